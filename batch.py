@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Meeting Minutes Processor - Bulk Batch Entry Point
+Submits many meeting minutes through the OpenAI Batch API and saves the results.
+"""
+
+import os
+import sys
+import argparse
+from config.env_loader import get_env_var
+from config.app_config import BATCH_POLL_INTERVAL, BATCH_MAX_MINUTES_CHARS
+from services.openai_service import set_api_key
+from services.batch_service import submit_batch, resume_batch
+from services.transcript_service import iter_transcript_chunks
+
+def _read_minutes(path):
+    """
+    Read meeting minutes from a file
+
+    Caption and DOCX transcripts are streamed as cleaned chunks via the
+    transcript service, one batch request pair per chunk; any other file is
+    read as plain minutes text and must fit in a single request.
+
+    Args:
+        path (str): Path to the minutes file
+
+    Returns:
+        str or iterator: Meeting minutes text, or an iterator of transcript chunks
+    """
+    if os.path.splitext(path)[1].lower() in (".vtt", ".srt", ".docx"):
+        return iter_transcript_chunks(path)
+
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as minutes_file:
+        text = minutes_file.read(BATCH_MAX_MINUTES_CHARS + 1)
+    if len(text) > BATCH_MAX_MINUTES_CHARS:
+        raise ValueError(
+            f"{path} is longer than {BATCH_MAX_MINUTES_CHARS} characters. "
+            f"Split it or convert it to a transcript format (.vtt, .srt, .docx) to process it in chunks."
+        )
+    return text
+
+def main():
+    parser = argparse.ArgumentParser(description="Process meeting minutes in bulk with the OpenAI Batch API")
+    parser.add_argument("--base-url", default=get_env_var("OPENAI_BASE_URL"),
+                        help="Alternative API base URL (e.g. a local stand-in server)")
+    parser.add_argument("--poll-interval", type=float, default=BATCH_POLL_INTERVAL,
+                        help="Seconds between batch status checks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    submit_parser = subparsers.add_parser("submit", help="Submit minutes files as a new batch")
+    submit_parser.add_argument("files", nargs="+", help="Minutes or transcript files")
+    submit_parser.add_argument("--no-wait", action="store_true",
+                               help="Print the batch ID and exit without waiting for results")
+
+    resume_parser = subparsers.add_parser("resume", help="Wait for an existing batch and save its results")
+    resume_parser.add_argument("batch_id", help="ID of a previously submitted batch")
+
+    args = parser.parse_args()
+
+    api_key = get_env_var("OPENAI_API_KEY")
+    if not api_key:
+        sys.exit("Error: OPENAI_API_KEY is not set")
+    try:
+        set_api_key(api_key, base_url=args.base_url)
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
+
+    if args.command == "submit":
+        try:
+            batch_id = submit_batch([_read_minutes(path) for path in args.files])
+        except ValueError as e:
+            sys.exit(f"Error: {e}")
+        print(f"Submitted batch {batch_id}")
+        if args.no_wait:
+            return
+    else:
+        batch_id = args.batch_id
+
+    try:
+        output_paths = resume_batch(batch_id, args.poll_interval)
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
+    for json_path, excel_path in output_paths:
+        print(f"Files created:\n{json_path}\n{excel_path}")
+
+if __name__ == "__main__":
+    main()
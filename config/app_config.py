@@ -2,10 +2,25 @@
 Application configuration settings
 """
 import os
+from config.env_loader import load_environment
+
+# Load .env first so settings below can be read from it
+load_environment()
 
 # OpenAI API configuration
 OPENAI_MODEL = "gpt-4o-2024-08-06"
 
+# OpenAI Batch API configuration
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL = 60  # seconds between batch status checks
+BATCH_MAX_MINUTES_CHARS = 100000  # plain minutes files longer than this are rejected
+
+# LLM traffic cassette configuration (record/replay chat completions for offline runs)
+CASSETTE_MODE = os.environ.get("APP_CASSETTE_MODE", "")  # "record", "replay" or empty
+CASSETTE_PATH = os.environ.get("APP_CASSETTE_PATH", "llm_cassette.jsonl.gz")
+CASSETTE_REPLAY_LATENCY = os.environ.get("APP_CASSETTE_LATENCY", "").lower() in ("1", "true", "yes")
+
 # File naming configuration
 DEFAULT_FILENAME_PREFIX = "Project_Items"
 TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
@@ -20,6 +35,14 @@ UI_WINDOW_TITLE = "Meeting Minutes to Project Plan Processor"
 UI_WINDOW_SIZE = "900x800"
 UI_INPUT_HEIGHT = 15
 UI_RESULT_HEIGHT = 20
+UI_RESULT_COLUMNS = ["TaskID", "WorkItem", "Stream", "Initiative", "Type", "AssignedTo", "Priority", "DueDate", "Stage"]
+UI_RESULT_CHUNK_SIZE = 200  # rows inserted into the results grid per UI update
 
 # Data validation handling
-VALIDATE_FIELDS = True
\ No newline at end of file
+VALIDATE_FIELDS = True
+REPAIR_INVALID_FIELDS = True  # Send enum values that fail validation back for one batched repair request
+
+# Transcript ingestion configuration
+TRANSCRIPT_CHUNK_CHARS = 12000
+TRANSCRIPT_EXCERPT_CHARS = 2000  # opening of a transcript kept in Minutes.raw_text
+TRANSCRIPT_FILLER_WORDS = ["um", "umm", "uh", "uhh", "uh-huh", "erm", "er", "hmm", "mhm", "mm", "ah"]
\ No newline at end of file
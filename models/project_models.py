@@ -4,7 +4,7 @@ Pydantic models for project items and meeting minutes
 
 from pydantic import BaseModel
 from typing import List, Optional
-from .enums import Stream, Substream, Initiative, ItemType, Stage
+from . import enums
 
 class ProjectItem(BaseModel):
     """
@@ -12,10 +12,10 @@ class ProjectItem(BaseModel):
     Contains all required fields for the project plan.
     """
     TaskID: Optional[str] = None
-    Stream: Optional[Stream] = None
-    Substream: Optional[Substream] = None
-    Initiative: Optional[Initiative] = None
-    Type: Optional[ItemType] = None
+    Stream: Optional[enums.Stream] = None
+    Substream: Optional[enums.Substream] = None
+    Initiative: Optional[enums.Initiative] = None
+    Type: Optional[enums.ItemType] = None
     WorkItem: Optional[str] = None
     Description: Optional[str] = None
     AssignedTo: Optional[str] = None
@@ -24,7 +24,7 @@ class ProjectItem(BaseModel):
     StartDate: Optional[str] = None
     DueDate: Optional[str] = None
     FinishDate: Optional[str] = None
-    Stage: Optional[Stage] = None
+    Stage: Optional[enums.Stage] = None
     Sprint: Optional[str] = None
     JiraID: Optional[str] = None
     KeyStakeholders: Optional[List[str]] = []
@@ -35,6 +35,16 @@ class ProjectItem(BaseModel):
     GanttItem: Optional[str] = None
     Screenshots: Optional[List[str]] = []
 
+class RepairStats(BaseModel):
+    """
+    Model for the outcome of the enum field repair pass.
+    Tracks how many invalid values were sent, fixed and left unresolved.
+    """
+    attempted: int = 0
+    repaired: int = 0
+    still_invalid: int = 0
+    total_tokens: int = 0
+
 class Minutes(BaseModel):
     """
     Model for structured meeting minutes.
@@ -45,4 +55,5 @@ class Minutes(BaseModel):
     meeting_date: Optional[str] = None
     attendees: List[str] = []
     summary: Optional[str] = None
-    items: List[ProjectItem] = []
\ No newline at end of file
+    items: List[ProjectItem] = []
+    repair_stats: Optional[RepairStats] = None
\ No newline at end of file
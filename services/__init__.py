@@ -2,12 +2,22 @@
 Services package initialization
 """
 
-from .openai_service import process_minutes
+from .openai_service import process_minutes, process_transcript
 from .excel_service import create_excel
 from .json_service import save_json
+from .transcript_service import iter_transcript_turns, iter_transcript_chunks
+from .batch_service import submit_batch, resume_batch, process_batch
+from .cassette_service import configure_cassette
 
 __all__ = [
     'process_minutes',
+    'process_transcript',
     'create_excel',
-    'save_json'
+    'save_json',
+    'iter_transcript_turns',
+    'iter_transcript_chunks',
+    'submit_batch',
+    'resume_batch',
+    'process_batch',
+    'configure_cassette'
 ]
\ No newline at end of file
@@ -0,0 +1,300 @@
+"""
+OpenAI Batch API service for bulk processing of meeting minutes
+"""
+
+import os
+import json
+import time
+from datetime import datetime
+from services import openai_service
+from services.openai_service import (
+    MEETING_INFO_PROMPT, PROJECT_ITEMS_PROMPT, _build_chat_request, _build_minutes,
+    _merge_chunk_results, _transcript_raw_text
+)
+from services.excel_service import create_excel
+from services.json_service import save_json
+from config.app_config import (
+    BATCH_ENDPOINT, BATCH_COMPLETION_WINDOW, BATCH_POLL_INTERVAL,
+    TIMESTAMP_FORMAT, DEFAULT_FILENAME_PREFIX, OUTPUT_DIR
+)
+
+# Request kinds sent for each set of minutes, keyed by custom_id suffix
+_REQUEST_PROMPTS = {
+    "meeting_info": MEETING_INFO_PROMPT,
+    "project_items": PROJECT_ITEMS_PROMPT,
+}
+
+# Batch statuses after which no further progress will be made
+_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+def _get_client():
+    """
+    Get the configured OpenAI client
+
+    Returns:
+        OpenAI: The client set via openai_service.set_api_key
+    """
+    if openai_service.client is None:
+        raise ValueError("OpenAI API key not set. Please set your API key first.")
+    if not hasattr(openai_service.client, "batches"):
+        # Cassette replay clients only serve chat completions
+        raise ValueError("The Batch API is not available in replay mode")
+    return openai_service.client
+
+def _custom_id(index, chunk, kind):
+    """Build the custom_id for one request of a chunk of a set of minutes"""
+    return f"minutes-{index}-{chunk}-{kind}"
+
+def _parse_custom_id(custom_id):
+    """
+    Split a custom_id back into its minutes index, chunk number and request kind
+
+    Args:
+        custom_id (str): custom_id created by _custom_id
+
+    Returns:
+        tuple: (index, chunk, kind)
+    """
+    _, index, chunk, kind = custom_id.split("-", 3)
+    return int(index), int(chunk), kind
+
+def _iter_jsonl(content):
+    """Yield parsed objects from JSONL text, skipping blank lines"""
+    for line in content.splitlines():
+        if line.strip():
+            yield json.loads(line)
+
+def _parse_response(response, kind):
+    """
+    Extract the JSON result from a successful batch response
+
+    Args:
+        response (dict): "response" object of a batch output line
+        kind (str): Request kind ("meeting_info" or "project_items")
+
+    Returns:
+        dict: Parsed result (project_items results always hold an "items" list)
+    """
+    content = response["body"]["choices"][0]["message"]["content"]
+    result = json.loads(content)
+    if not isinstance(result, dict):
+        raise ValueError("expected a JSON object")
+
+    if kind == "project_items":
+        items = result.get('items') or []
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            raise ValueError("expected 'items' to be a list of objects")
+        result['items'] = items
+    return result
+
+def create_batch_file(documents, output_path=None):
+    """
+    Write a Batch API JSONL request file for a list of meeting minutes
+
+    Each chunk of each set of minutes produces one request per extraction
+    prompt. Chunks are consumed one at a time, so transcript chunk
+    generators are streamed straight into the file.
+
+    Args:
+        documents (list): Minutes texts, or iterables of text chunks (e.g. from
+            iter_transcript_chunks) for minutes too long for one request
+        output_path (str, optional): Path to save the JSONL file
+
+    Returns:
+        str: Path to the created JSONL file
+    """
+    if output_path is None:
+        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+        filename = f"{DEFAULT_FILENAME_PREFIX}_Batch_{timestamp}.jsonl"
+
+        # Use output directory if specified
+        if OUTPUT_DIR:
+            output_path = os.path.join(OUTPUT_DIR, filename)
+        else:
+            output_path = filename
+
+    with open(output_path, 'w') as jsonl_file:
+        for index, document in enumerate(documents):
+            chunks = [document] if isinstance(document, str) else document
+            for chunk, text in enumerate(chunks):
+                for kind, prompt in _REQUEST_PROMPTS.items():
+                    request = {
+                        "custom_id": _custom_id(index, chunk, kind),
+                        "method": "POST",
+                        "url": BATCH_ENDPOINT,
+                        "body": _build_chat_request(prompt, text),
+                    }
+                    jsonl_file.write(json.dumps(request) + "\n")
+
+    return output_path
+
+def submit_batch(documents, request_path=None):
+    """
+    Create a Batch API request file for the minutes and submit it
+
+    Args:
+        documents (list): Minutes texts, or iterables of text chunks
+        request_path (str, optional): Path to save the JSONL request file
+
+    Returns:
+        str: ID of the submitted batch
+    """
+    client = _get_client()
+    request_path = create_batch_file(documents, request_path)
+
+    with open(request_path, 'rb') as request_file:
+        input_file = client.files.create(file=request_file, purpose="batch")
+
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=BATCH_COMPLETION_WINDOW
+    )
+    return batch.id
+
+def wait_for_batch(batch_id, poll_interval=BATCH_POLL_INTERVAL):
+    """
+    Poll a batch until it reaches a final status
+
+    Args:
+        batch_id (str): ID of the batch
+        poll_interval (float): Seconds to wait between status checks
+
+    Returns:
+        Batch: The batch in its final state
+    """
+    client = _get_client()
+
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in _FINAL_STATUSES:
+            return batch
+
+        counts = batch.request_counts
+        if counts is not None:
+            print(f"Batch {batch_id} {batch.status}: {counts.completed}/{counts.total} requests done")
+        time.sleep(poll_interval)
+
+def collect_batch_results(batch):
+    """
+    Download a completed batch and rebuild the Minutes objects
+
+    The original minutes texts are recovered from the batch input file, so
+    results can be collected from the batch ID alone. Invalid enum values are
+    not repaired in batch mode; they are counted under repair_stats.still_invalid.
+
+    Args:
+        batch (Batch): Batch in its final state
+
+    Returns:
+        dict: Minutes objects keyed by submission index (failed minutes are skipped)
+    """
+    client = _get_client()
+    if batch.status != "completed":
+        raise ValueError(f"Batch {batch.id} finished with status '{batch.status}'")
+
+    # Recover the minutes text chunks from the submitted requests
+    texts = {}
+    for request in _iter_jsonl(client.files.content(batch.input_file_id).text):
+        index, chunk, _ = _parse_custom_id(request["custom_id"])
+        texts.setdefault(index, {})[chunk] = request["body"]["messages"][-1]["content"]
+
+    # Parse the model responses
+    results = {}
+    failed = set()
+    if batch.output_file_id:
+        for line in _iter_jsonl(client.files.content(batch.output_file_id).text):
+            index, chunk, kind = _parse_custom_id(line["custom_id"])
+            response = line.get("response") or {}
+            if line.get("error") or response.get("status_code") != 200:
+                print(f"Request {line['custom_id']} failed: {line.get('error') or response.get('body')}")
+                failed.add(index)
+                continue
+            try:
+                results[(index, chunk, kind)] = _parse_response(response, kind)
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                # Treat an unusable response like a failed request
+                print(f"Request {line['custom_id']} returned an invalid response: {e}")
+                failed.add(index)
+
+    if batch.error_file_id:
+        for line in _iter_jsonl(client.files.content(batch.error_file_id).text):
+            index, _, _ = _parse_custom_id(line["custom_id"])
+            print(f"Request {line['custom_id']} failed: {line.get('error') or line.get('response')}")
+            failed.add(index)
+
+    minutes_by_index = {}
+    for index in sorted(texts):
+        chunks = [texts[index][chunk] for chunk in sorted(texts[index])]
+        chunk_results = []
+        for chunk in sorted(texts[index]):
+            meeting_info = results.get((index, chunk, "meeting_info"))
+            project_items = results.get((index, chunk, "project_items"))
+            if meeting_info is None or project_items is None:
+                break
+            chunk_results.append((meeting_info, project_items['items']))
+
+        if index in failed or len(chunk_results) != len(chunks):
+            print(f"Skipping minutes {index}: incomplete batch results")
+            continue
+
+        try:
+            if len(chunks) == 1:
+                text = chunks[0]
+                meeting_info, project_items_data = chunk_results[0]
+            else:
+                # Merge chunked transcripts without the synchronous summary request
+                text = _transcript_raw_text(chunks[0], len(chunks))
+                meeting_info, project_items_data = _merge_chunk_results(chunk_results, summarize=False)
+
+            # Skip the repair pass: it would send one full-price synchronous
+            # request per set of minutes, defeating the point of the Batch API
+            minutes_by_index[index] = _build_minutes(
+                text, meeting_info, project_items_data, repair=False
+            )
+        except (TypeError, ValueError) as e:
+            # Field values of the wrong type only affect this set of minutes
+            print(f"Skipping minutes {index}: invalid batch results: {e}")
+
+    return minutes_by_index
+
+def resume_batch(batch_id, poll_interval=BATCH_POLL_INTERVAL):
+    """
+    Wait for a submitted batch and save JSON and Excel files for its results
+
+    Args:
+        batch_id (str): ID of the batch
+        poll_interval (float): Seconds to wait between status checks
+
+    Returns:
+        list: (json_path, excel_path) tuples, one per processed set of minutes
+    """
+    batch = wait_for_batch(batch_id, poll_interval)
+
+    output_paths = []
+    for index, minutes_data in collect_batch_results(batch).items():
+        # Name files by batch and index so meetings with the same title don't collide
+        filename = f"{DEFAULT_FILENAME_PREFIX}_{batch_id}_{index}"
+        if OUTPUT_DIR:
+            filename = os.path.join(OUTPUT_DIR, filename)
+
+        json_path = save_json(minutes_data, f"{filename}.json")
+        excel_path = create_excel(minutes_data, f"{filename}.xlsx")
+        output_paths.append((json_path, excel_path))
+
+    return output_paths
+
+def process_batch(documents, poll_interval=BATCH_POLL_INTERVAL):
+    """
+    Submit minutes through the Batch API and save the results once complete
+
+    Args:
+        documents (list): Minutes texts, or iterables of text chunks
+        poll_interval (float): Seconds to wait between status checks
+
+    Returns:
+        list: (json_path, excel_path) tuples, one per processed set of minutes
+    """
+    batch_id = submit_batch(documents)
+    print(f"Submitted batch {batch_id}")
+    return resume_batch(batch_id, poll_interval)
@@ -0,0 +1,154 @@
+"""
+Record/replay cassette service for chat completion traffic
+Captures OpenAI chat completion request/response pairs to a compressed file
+and serves them back offline
+"""
+
+import json
+import gzip
+import time
+import hashlib
+from collections import defaultdict
+from openai.types.chat import ChatCompletion
+from config.app_config import CASSETTE_MODE, CASSETTE_PATH, CASSETTE_REPLAY_LATENCY
+
+CASSETTE_MODES = ("record", "replay")
+
+# Active cassette settings (see configure_cassette)
+_mode = None
+_path = CASSETTE_PATH
+_replay_latency = False
+
+def _request_key(request):
+    """
+    Build a stable key for a chat completion request
+
+    Args:
+        request (dict): Keyword arguments for client.chat.completions.create
+
+    Returns:
+        str: SHA-256 hex digest of the canonical request JSON
+    """
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class _Namespace:
+    """Attribute container mimicking client.chat.completions"""
+
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+class RecordingClient:
+    """
+    Wraps an OpenAI client and appends every chat completion to a cassette.
+
+    Each call is written as its own gzip member, so a cassette survives
+    interrupted runs and grows across sessions.
+    """
+
+    def __init__(self, client, path):
+        self._client = client
+        self._path = path
+        self.chat = _Namespace(completions=_Namespace(create=self._create))
+
+    def __getattr__(self, name):
+        # Anything other than chat completions goes straight to the real client
+        return getattr(self._client, name)
+
+    def _create(self, **request):
+        start = time.perf_counter()
+        completion = self._client.chat.completions.create(**request)
+        latency = time.perf_counter() - start
+
+        record = {
+            "key": _request_key(request),
+            "request": request,
+            "response": completion.model_dump(mode="json"),
+            "latency": latency,
+        }
+        with gzip.open(self._path, "at", encoding="utf-8") as cassette_file:
+            cassette_file.write(json.dumps(record) + "\n")
+
+        return completion
+
+class ReplayClient:
+    """
+    Serves chat completions from a cassette without contacting the API.
+
+    Identical requests are answered in the order they were recorded; once
+    those are used up the last recorded response is repeated.
+    """
+
+    def __init__(self, path, replay_latency=False):
+        self._path = path
+        self._replay_latency = replay_latency
+        self._records = defaultdict(list)
+        self._positions = defaultdict(int)
+        self.chat = _Namespace(completions=_Namespace(create=self._create))
+
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as cassette_file:
+                for line in cassette_file:
+                    if line.strip():
+                        record = json.loads(line)
+                        self._records[record["key"]].append(record)
+        except FileNotFoundError:
+            raise ValueError(f"Cassette file not found: {path}. Record one first with cassette mode 'record'.")
+
+    def __getattr__(self, name):
+        # Only chat completions are recorded; fail clearly for anything else
+        # (as an AttributeError so hasattr and getattr defaults still work)
+        if name.startswith("_"):
+            raise AttributeError(name)
+        raise AttributeError(f"'{name}' is not available in replay mode (only chat completions are replayed)")
+
+    def _create(self, **request):
+        key = _request_key(request)
+        records = self._records.get(key)
+        if not records:
+            raise ValueError(f"No recorded response for this request in cassette {self._path}")
+
+        position = self._positions[key]
+        record = records[min(position, len(records) - 1)]
+        self._positions[key] = position + 1
+
+        if self._replay_latency:
+            time.sleep(record["latency"])
+
+        return ChatCompletion.model_validate(record["response"])
+
+def configure_cassette(mode, path=CASSETTE_PATH, replay_latency=False):
+    """
+    Set the cassette mode used for clients created afterwards
+
+    Args:
+        mode (str): "record", "replay", or None to talk to the API directly
+        path (str): Path to the gzip-compressed JSONL cassette file
+        replay_latency (bool): In replay mode, sleep for each call's recorded latency
+    """
+    global _mode, _path, _replay_latency
+    if mode and mode not in CASSETTE_MODES:
+        raise ValueError(f"Invalid cassette mode '{mode}'. Valid modes: {', '.join(CASSETTE_MODES)}")
+
+    _mode = mode or None
+    _path = path
+    _replay_latency = replay_latency
+
+def wrap_client(client):
+    """
+    Apply the configured cassette mode to an OpenAI client
+
+    Args:
+        client (OpenAI): Client created from the API key
+
+    Returns:
+        The client itself, a RecordingClient, or a ReplayClient
+    """
+    if _mode == "record":
+        return RecordingClient(client, _path)
+    if _mode == "replay":
+        return ReplayClient(_path, _replay_latency)
+    return client
+
+# Apply the mode configured through the environment
+configure_cassette(CASSETTE_MODE, CASSETTE_PATH, CASSETTE_REPLAY_LATENCY)
\ No newline at end of file
@@ -5,36 +5,16 @@ OpenAI API service for processing meeting minutes
 import json
 from openai import OpenAI
 from models.enums import Stream, Substream, Initiative, ItemType, Stage
-from models.project_models import ProjectItem, Minutes
-from config.app_config import OPENAI_MODEL
+from models.project_models import ProjectItem, Minutes, RepairStats
+from config.app_config import OPENAI_MODEL, REPAIR_INVALID_FIELDS, TRANSCRIPT_EXCERPT_CHARS
+from services.transcript_service import iter_transcript_chunks
+from services.cassette_service import wrap_client
 
 # Initialize the OpenAI client with None (will be set later)
 client = None
 
-def set_api_key(api_key):
-    """
-    Set the OpenAI API key
-    
-    Args:
-        api_key (str): The OpenAI API key
-    """
-    global client
-    client = OpenAI(api_key=api_key)
-
-def _extract_meeting_info(text):
-    """
-    Extract basic meeting information like title, date, attendees, and summary
-    
-    Args:
-        text (str): Raw meeting minutes text
-        
-    Returns:
-        dict: Extracted meeting information
-    """
-    if client is None:
-        raise ValueError("OpenAI API key not set. Please set your API key first.")
-        
-    meeting_info_prompt = """
+# Extraction prompts
+MEETING_INFO_PROMPT = """
     Extract the following information from the meeting minutes: 
     - meeting_title: The title or name of the meeting
     - meeting_date: The date when the meeting was held
@@ -43,32 +23,8 @@ def _extract_meeting_info(text):
     
     Return the information in JSON format.
     """
-    
-    meeting_info_completion = client.chat.completions.create(
-        model=OPENAI_MODEL,
-        messages=[
-            {"role": "system", "content": meeting_info_prompt},
-            {"role": "user", "content": text},
-        ],
-        response_format={"type": "json_object"}
-    )
-    
-    return json.loads(meeting_info_completion.choices[0].message.content)
 
-def _extract_project_items(text):
-    """
-    Extract project items from the meeting minutes
-    
-    Args:
-        text (str): Raw meeting minutes text
-        
-    Returns:
-        list: List of project item dictionaries
-    """
-    if client is None:
-        raise ValueError("OpenAI API key not set. Please set your API key first.")
-        
-    project_items_prompt = """
+PROJECT_ITEMS_PROMPT = """
     Based on the meeting minutes, identify tasks, action items, decisions, or any work that needs to be done.
     For each item, extract as much of the following information as possible:
     
@@ -99,62 +55,228 @@ def _extract_project_items(text):
     Provide the output as a JSON object with an "items" key containing an array of objects, with each object containing the fields above where information is available.
     If a field requires specific values (Stream, Substream, Initiative, Type, Stage), use only the provided options or leave empty.
     """
+
+REPAIR_PROMPT = """
+    Some project items extracted from meeting minutes have field values that are not in the allowed list.
+    The input is a JSON object with "allowed_values" (the allowed options for each field) and "fields"
+    (each with an "id", the item title, the field name and the invalid value).
+    
+    For each entry in "fields", choose the allowed option that best matches the invalid value and item title.
+    Use only the exact allowed strings. If no option is a reasonable match, use null.
+    
+    Provide the output as a JSON object with a "repairs" key mapping each "id" to the chosen option.
+    """
+
+SUMMARY_PROMPT = """
+    The input contains summaries of consecutive parts of one long meeting, separated by blank lines.
+    Combine them into a single brief summary of what was discussed across the whole meeting.
     
-    project_items_completion = client.chat.completions.create(
-        model=OPENAI_MODEL,
-        messages=[
-            {"role": "system", "content": project_items_prompt},
+    Return the information in JSON format with a "summary" key.
+    """
+
+# Enum-constrained ProjectItem fields and their valid options
+ENUM_FIELDS = {
+    'Stream': Stream,
+    'Substream': Substream,
+    'Initiative': Initiative,
+    'Type': ItemType,
+    'Stage': Stage,
+}
+
+def set_api_key(api_key, base_url=None):
+    """
+    Set the OpenAI API key
+    
+    Args:
+        api_key (str): The OpenAI API key
+        base_url (str, optional): Alternative API base URL (e.g. a local stand-in server)
+    """
+    global client
+    # Record or replay chat completions if a cassette mode is configured
+    client = wrap_client(OpenAI(api_key=api_key, base_url=base_url))
+
+def _build_chat_request(prompt, text):
+    """
+    Build the chat completion request parameters for an extraction prompt
+    
+    Args:
+        prompt (str): System prompt for the extraction
+        text (str): Raw meeting minutes text
+        
+    Returns:
+        dict: Keyword arguments for client.chat.completions.create
+    """
+    return {
+        "model": OPENAI_MODEL,
+        "messages": [
+            {"role": "system", "content": prompt},
             {"role": "user", "content": text},
         ],
-        response_format={"type": "json_object"}
+        "response_format": {"type": "json_object"}
+    }
+
+def _extract_meeting_info(text):
+    """
+    Extract basic meeting information like title, date, attendees, and summary
+    
+    Args:
+        text (str): Raw meeting minutes text
+        
+    Returns:
+        dict: Extracted meeting information
+    """
+    if client is None:
+        raise ValueError("OpenAI API key not set. Please set your API key first.")
+        
+    meeting_info_completion = client.chat.completions.create(
+        **_build_chat_request(MEETING_INFO_PROMPT, text)
+    )
+    
+    return json.loads(meeting_info_completion.choices[0].message.content)
+
+def _extract_project_items(text):
+    """
+    Extract project items from the meeting minutes
+    
+    Args:
+        text (str): Raw meeting minutes text
+        
+    Returns:
+        list: List of project item dictionaries
+    """
+    if client is None:
+        raise ValueError("OpenAI API key not set. Please set your API key first.")
+        
+    project_items_completion = client.chat.completions.create(
+        **_build_chat_request(PROJECT_ITEMS_PROMPT, text)
     )
     
     result = json.loads(project_items_completion.choices[0].message.content)
     return result.get('items', [])
 
-def _validate_project_item(item_data):
+def _validate_project_item(item_data, invalid_fields=None):
     """
     Validate and clean up project item data
     
     Args:
         item_data (dict): Raw project item data
+        invalid_fields (list, optional): Collects (field, value) pairs that failed validation
         
     Returns:
         dict: Validated project item data
     """
     # Handle enum fields by checking if they match valid options
-    if 'Stream' in item_data and item_data['Stream']:
-        try:
-            item_data['Stream'] = Stream(item_data['Stream'])
-        except ValueError:
-            item_data['Stream'] = None
-            
-    if 'Substream' in item_data and item_data['Substream']:
-        try:
-            item_data['Substream'] = Substream(item_data['Substream'])
-        except ValueError:
-            item_data['Substream'] = None
-            
-    if 'Initiative' in item_data and item_data['Initiative']:
-        try:
-            item_data['Initiative'] = Initiative(item_data['Initiative'])
-        except ValueError:
-            item_data['Initiative'] = None
-            
-    if 'Type' in item_data and item_data['Type']:
-        try:
-            item_data['Type'] = ItemType(item_data['Type'])
-        except ValueError:
-            item_data['Type'] = None
-            
-    if 'Stage' in item_data and item_data['Stage']:
-        try:
-            item_data['Stage'] = Stage(item_data['Stage'])
-        except ValueError:
-            item_data['Stage'] = None
+    for field, enum_class in ENUM_FIELDS.items():
+        if field in item_data and item_data[field]:
+            try:
+                item_data[field] = enum_class(item_data[field])
+            except ValueError:
+                if invalid_fields is not None:
+                    invalid_fields.append((field, item_data[field]))
+                item_data[field] = None
     
     return item_data
 
+def _repair_invalid_fields(items_data, failures):
+    """
+    Ask the model to map invalid enum values onto the allowed options
+    
+    All failed fields across the meeting are sent in a single request.
+    
+    Args:
+        items_data (list): Validated project item dictionaries (patched in place)
+        failures (list): (item_index, field, invalid_value) tuples
+        
+    Returns:
+        RepairStats: Counts of repaired and still-invalid values
+    """
+    stats = RepairStats(attempted=len(failures))
+    
+    fields = sorted({field for _, field, _ in failures})
+    payload = {
+        "allowed_values": {field: [e.value for e in ENUM_FIELDS[field]] for field in fields},
+        "fields": [
+            {
+                "id": f"{item_index}.{field}",
+                "item": items_data[item_index].get('WorkItem') or items_data[item_index].get('Description'),
+                "field": field,
+                "value": value,
+            }
+            for item_index, field, value in failures
+        ],
+    }
+    
+    try:
+        repair_completion = client.chat.completions.create(
+            **_build_chat_request(REPAIR_PROMPT, json.dumps(payload))
+        )
+        if repair_completion.usage is not None:
+            stats.total_tokens = repair_completion.usage.total_tokens
+        result = json.loads(repair_completion.choices[0].message.content)
+        repairs = result.get('repairs') if isinstance(result, dict) else None
+    except Exception as e:
+        print(f"Error repairing invalid fields: {e}")
+        repairs = None
+    
+    # The repair pass is best-effort: ignore responses of the wrong shape
+    if not isinstance(repairs, dict):
+        repairs = {}
+    
+    # Patch back only values that now map onto the enum
+    for item_index, field, _ in failures:
+        try:
+            items_data[item_index][field] = ENUM_FIELDS[field](repairs.get(f"{item_index}.{field}"))
+            stats.repaired += 1
+        except (ValueError, TypeError):
+            stats.still_invalid += 1
+    
+    return stats
+
+def _build_minutes(text, meeting_info, project_items_data, repair=REPAIR_INVALID_FIELDS):
+    """
+    Build a Minutes object from extracted meeting information and project items
+    
+    Args:
+        text (str): Raw meeting minutes text
+        meeting_info (dict): Extracted meeting information
+        project_items_data (list): List of project item dictionaries
+        repair (bool): Send invalid enum values for a synchronous repair request;
+            when False they are only counted as still invalid
+        
+    Returns:
+        Minutes: Structured minutes data
+    """
+    # Create the Minutes object
+    minutes = Minutes(
+        raw_text=text,
+        meeting_title=meeting_info.get('meeting_title', ''),
+        meeting_date=meeting_info.get('meeting_date', ''),
+        attendees=meeting_info.get('attendees', []),
+        summary=meeting_info.get('summary', ''),
+        items=[]
+    )
+    
+    # Validate the item data, collecting enum values that could not be mapped
+    validated_items_data = []
+    failures = []
+    for item_index, item_data in enumerate(project_items_data):
+        invalid_fields = []
+        validated_items_data.append(_validate_project_item(item_data, invalid_fields))
+        failures.extend((item_index, field, value) for field, value in invalid_fields)
+    
+    # Send only the failed fields back for a targeted repair
+    if failures and repair and client is not None:
+        minutes.repair_stats = _repair_invalid_fields(validated_items_data, failures)
+    elif failures:
+        minutes.repair_stats = RepairStats(still_invalid=len(failures))
+    
+    # Create and add the project items
+    for validated_item_data in validated_items_data:
+        project_item = ProjectItem(**validated_item_data)
+        minutes.items.append(project_item)
+    
+    return minutes
+
 def process_minutes(text):
     """
     Process the minutes using OpenAI's API and return structured data
@@ -175,27 +297,150 @@ def process_minutes(text):
         # Extract project items
         project_items_data = _extract_project_items(text)
         
-        # Create the Minutes object
-        minutes = Minutes(
-            raw_text=text,
-            meeting_title=meeting_info.get('meeting_title', ''),
-            meeting_date=meeting_info.get('meeting_date', ''),
-            attendees=meeting_info.get('attendees', []),
-            summary=meeting_info.get('summary', ''),
-            items=[]
-        )
+        return _build_minutes(text, meeting_info, project_items_data)
+    
+    except Exception as e:
+        print(f"Error processing minutes: {e}")
+        raise
+
+def _summarize_summaries(summaries):
+    """
+    Combine per-chunk summaries of a long meeting into one summary
+    
+    Args:
+        summaries (list): Summaries of consecutive parts of the meeting
+        
+    Returns:
+        str: Summary of the whole meeting
+    """
+    summary_completion = client.chat.completions.create(
+        **_build_chat_request(SUMMARY_PROMPT, "\n\n".join(summaries))
+    )
+    
+    result = json.loads(summary_completion.choices[0].message.content)
+    summary = result.get('summary') if isinstance(result, dict) else None
+    return summary if isinstance(summary, str) and summary else " ".join(summaries)
+
+def _merge_chunk_results(chunk_results, speakers=(), summarize=True):
+    """
+    Merge meeting information and project items extracted from transcript chunks
+    
+    Attendees are combined across chunks (plus known speakers), TaskIDs are
+    prefixed with their chunk number so they stay unique, and items repeated
+    in several chunks are kept once.
+    
+    Args:
+        chunk_results (list): (meeting_info, project_items_data) per chunk, in order
+        speakers (list): Speaker names found in the transcript
+        summarize (bool): Combine per-chunk summaries with a model request;
+            otherwise they are joined as-is
         
-        # Parse and validate project items
-        for item_data in project_items_data:
-            # Validate the item data
-            validated_item_data = _validate_project_item(item_data)
+    Returns:
+        tuple: (meeting_info dict, list of project item dictionaries)
+    """
+    meeting_info = {'meeting_title': '', 'meeting_date': '', 'attendees': [], 'summary': ''}
+    summaries = []
+    seen_attendees = set()
+    
+    def add_attendee(name):
+        if isinstance(name, str) and name.strip() and name.strip().lower() not in seen_attendees:
+            seen_attendees.add(name.strip().lower())
+            meeting_info['attendees'].append(name.strip())
+    
+    for chunk_info, _ in chunk_results:
+        for key in ('meeting_title', 'meeting_date'):
+            if not meeting_info[key] and chunk_info.get(key):
+                meeting_info[key] = chunk_info[key]
+        for name in chunk_info.get('attendees') or []:
+            add_attendee(name)
+        if isinstance(chunk_info.get('summary'), str) and chunk_info['summary'].strip():
+            summaries.append(chunk_info['summary'].strip())
+    for name in speakers:
+        add_attendee(name)
+    
+    if len(summaries) > 1 and summarize:
+        meeting_info['summary'] = _summarize_summaries(summaries)
+    else:
+        meeting_info['summary'] = " ".join(summaries)
+    
+    project_items_data = []
+    seen_items = set()
+    for chunk_number, (_, chunk_items) in enumerate(chunk_results, start=1):
+        for position, item_data in enumerate(chunk_items, start=1):
+            # Skip items already extracted from an earlier chunk
+            work_item = item_data.get('WorkItem')
+            if isinstance(work_item, str) and work_item.strip():
+                item_key = (work_item.strip().lower(), str(item_data.get('AssignedTo') or '').strip().lower())
+                if item_key in seen_items:
+                    continue
+                seen_items.add(item_key)
             
-            # Create and add the project item
-            project_item = ProjectItem(**validated_item_data)
-            minutes.items.append(project_item)
+            # Each chunk numbers its own items, so prefix TaskIDs with the chunk
+            if len(chunk_results) > 1:
+                item_data['TaskID'] = f"{chunk_number}-{item_data.get('TaskID') or position}"
+            project_items_data.append(item_data)
+    
+    return meeting_info, project_items_data
+
+def _transcript_raw_text(first_chunk, chunk_count, source=None):
+    """
+    Build a short raw_text for a chunked transcript
+    
+    Only the opening of the transcript is kept, so memory use does not grow
+    with the length of the meeting.
+    
+    Args:
+        first_chunk (str): First cleaned transcript chunk
+        chunk_count (int): Number of chunks in the transcript
+        source (str, optional): Path of the transcript file
         
-        return minutes
+    Returns:
+        str: Source line followed by an excerpt of the transcript
+    """
+    header = f"Transcript: {source}" if source else "Transcript"
+    excerpt = first_chunk[:TRANSCRIPT_EXCERPT_CHARS]
+    if chunk_count > 1 or len(first_chunk) > len(excerpt):
+        header += f" (excerpt of {chunk_count} chunk{'s' if chunk_count != 1 else ''})"
+    return f"{header}\n\n{excerpt}"
+
+def process_transcript(path):
+    """
+    Process a transcript file (VTT, SRT, DOCX or TXT) and return structured data
+    
+    The transcript is streamed from disk in cleaned chunks, so only one chunk
+    is held and sent to the API at a time. Meeting information and project
+    items are extracted from every chunk and merged: attendees include every
+    speaker, the summary covers the whole meeting and TaskIDs stay unique.
+    The returned raw_text holds the source path and an excerpt of the opening.
+    
+    Args:
+        path (str): Path to the transcript file
+        
+    Returns:
+        Minutes: Structured minutes data
+    """
+    if client is None:
+        raise ValueError("OpenAI API key not set. Please set your API key first.")
+        
+    try:
+        chunk_results = []
+        speakers = []
+        first_chunk = None
+        
+        for chunk in iter_transcript_chunks(path, speakers=speakers):
+            if first_chunk is None:
+                first_chunk = chunk
+            
+            # Extract meeting information and project items from every chunk
+            chunk_results.append((_extract_meeting_info(chunk), _extract_project_items(chunk)))
+        
+        if first_chunk is None:
+            raise ValueError(f"No transcript text found in {path}")
+        
+        meeting_info, project_items_data = _merge_chunk_results(chunk_results, speakers)
+        raw_text = _transcript_raw_text(first_chunk, len(chunk_results), path)
+        return _build_minutes(raw_text, meeting_info, project_items_data)
     
     except Exception as e:
-        print(f"Error processing minutes: {e}")
+        print(f"Error processing transcript: {e}")
         raise
\ No newline at end of file
@@ -0,0 +1,387 @@
+"""
+Transcript ingestion service
+Streams meeting transcripts (VTT, SRT, DOCX, TXT) from disk as cleaned speaker turns
+"""
+
+import os
+import re
+import zipfile
+from xml.etree import ElementTree
+from config.app_config import TRANSCRIPT_CHUNK_CHARS, TRANSCRIPT_FILLER_WORDS
+
+SUPPORTED_TRANSCRIPT_EXTENSIONS = (".vtt", ".srt", ".docx", ".txt")
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# "<v Jane Doe>Hello</v>" voice spans used by Teams/WebVTT captions
+_VOICE_TAG_RE = re.compile(r"^<v(?:\.[^\s>]*)?\s+([^>]+)>(.*)$")
+# Any remaining caption markup such as <c>, <i> or closing </v>
+_MARKUP_RE = re.compile(r"<[^>]+>")
+# "Jane Doe: Hello" speaker prefix used by Zoom captions and plain text exports
+_SPEAKER_PREFIX_RE = re.compile(r"^([A-Z][\w.'\- ]{0,40}?):\s+(.*)$")
+# "Jane Doe   0:03" speaker header line used by Teams DOCX/TXT exports
+_SPEAKER_HEADER_RE = re.compile(r"^([A-Z][\w.'\- ]{0,40}?)(?:\s{2,}|\t)(?:\d{1,2}:)?\d{1,2}:\d{2}$")
+# Leading "[00:01:02]" or "00:01:02" timestamps
+_LEADING_TIMESTAMP_RE = re.compile(r"^\[?(?:\d{1,2}:)?\d{1,2}:\d{2}(?:[.,]\d+)?\]?\s*")
+_FILLER_RE = re.compile(
+    r"(?:,\s*)?(?<![\w-])(?:"
+    + "|".join(re.escape(word) for word in sorted(TRANSCRIPT_FILLER_WORDS, key=len, reverse=True))
+    + r")(?![\w-])[,.!?]?",
+    re.IGNORECASE
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+def _clean_text(text):
+    """
+    Remove markup, filler words and redundant whitespace from a line of speech
+
+    Args:
+        text (str): Raw line of speech
+
+    Returns:
+        str: Cleaned text (may be empty)
+    """
+    text = _MARKUP_RE.sub("", text)
+    text = _FILLER_RE.sub("", text)
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    return text.lstrip(",.;:!? ")
+
+def _split_speaker(text):
+    """
+    Split a "Speaker: text" line into its parts
+
+    Args:
+        text (str): Line of speech
+
+    Returns:
+        tuple: (speaker or None, text)
+    """
+    match = _SPEAKER_PREFIX_RE.match(text)
+    if match:
+        return match.group(1).strip(), match.group(2)
+    return None, text
+
+def _take_words(text, max_chars):
+    """
+    Take at most max_chars from the start of text, breaking at a word boundary
+
+    Args:
+        text (str): Text to take from
+        max_chars (int): Maximum length of the piece taken
+
+    Returns:
+        tuple: (piece, remaining text)
+    """
+    if len(text) <= max_chars:
+        return text, ""
+    cut = text.rfind(" ", 0, max_chars + 1)
+    if cut <= 0:
+        # A single word longer than max_chars is split mid-word
+        cut = max_chars
+    return text[:cut], text[cut:].lstrip()
+
+def _split_text(text, max_chars):
+    """
+    Split text into pieces of at most max_chars, breaking at word boundaries
+
+    Args:
+        text (str): Text to split
+        max_chars (int): Maximum length of a piece
+
+    Yields:
+        str: Pieces of the text
+    """
+    while text:
+        piece, text = _take_words(text, max_chars)
+        yield piece
+
+def _cut_at_word(text):
+    """
+    Cut text at its last whitespace so a word is not split across reads
+
+    Args:
+        text (str): Text read up to a size limit
+
+    Returns:
+        tuple: (text up to the last word boundary, remainder to carry over)
+    """
+    cut = max(text.rfind(" "), text.rfind("\t"))
+    if cut <= 0:
+        return text, ""
+    return text[:cut], text[cut + 1:]
+
+def _iter_caption_turns(path):
+    """
+    Yield speaker turns from a VTT or SRT caption file
+
+    Cues are read one block at a time, so memory use is bounded by the
+    size of a single cue rather than the whole file.
+
+    Args:
+        path (str): Path to the caption file
+
+    Yields:
+        tuple: (speaker or None, text, whether the speaker is known)
+    """
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as caption_file:
+        block = []
+        for line in caption_file:
+            line = line.strip()
+            if line:
+                block.append(line)
+                continue
+            yield from _iter_cue_turns(block)
+            block = []
+        yield from _iter_cue_turns(block)
+
+def _iter_cue_turns(block):
+    """
+    Yield speaker turns from the lines of a single caption cue
+
+    Args:
+        block (list): Non-empty lines of one cue
+
+    Yields:
+        tuple: (speaker or None, text, whether the speaker is known)
+    """
+    # Cue identifiers (SRT indices, VTT ids) precede the timing line; the
+    # WEBVTT header, NOTE and STYLE blocks have no timing line at all.
+    timing_index = next((i for i, line in enumerate(block) if "-->" in line), None)
+    if timing_index is None:
+        return
+
+    # A <v Name> voice span can wrap over several lines of the cue; its
+    # speaker applies until </v> or the next voice tag. A Zoom-style
+    # "Name: text" prefix likewise applies to the rest of the cue.
+    speaker = None
+    in_voice = False
+    for line in block[timing_index + 1:]:
+        match = _VOICE_TAG_RE.match(line)
+        if match:
+            speaker = match.group(1).strip()
+            text = match.group(2)
+            in_voice = True
+        elif in_voice:
+            text = line
+        else:
+            prefix, text = _split_speaker(_MARKUP_RE.sub("", line))
+            if prefix:
+                speaker = prefix
+
+        yield speaker, text, speaker is not None
+        if in_voice and "</v>" in text:
+            speaker = None
+            in_voice = False
+
+def _iter_docx_paragraphs(path, max_chars=TRANSCRIPT_CHUNK_CHARS):
+    """
+    Yield paragraph text from a DOCX file without loading the whole document
+
+    Paragraphs longer than max_chars are yielded in pieces at word boundaries.
+
+    Args:
+        path (str): Path to the DOCX file
+        max_chars (int): Maximum length of a yielded piece
+
+    Yields:
+        str: Text of each paragraph (or paragraph piece)
+    """
+    with zipfile.ZipFile(path) as docx_file:
+        with docx_file.open("word/document.xml") as document_xml:
+            parts = []
+            length = 0
+            for _, element in ElementTree.iterparse(document_xml, events=("end",)):
+                if element.tag == f"{_WORD_NS}t":
+                    parts.append(element.text or "")
+                    length += len(parts[-1])
+                    element.clear()
+                elif element.tag in (f"{_WORD_NS}tab", f"{_WORD_NS}br"):
+                    parts.append(" ")
+                    length += 1
+                elif element.tag == f"{_WORD_NS}p":
+                    yield "".join(parts)
+                    parts = []
+                    length = 0
+                    element.clear()
+                    continue
+
+                # Flush oversized paragraphs instead of holding them whole
+                if length > max_chars:
+                    piece, carry = _cut_at_word("".join(parts))
+                    yield piece
+                    parts = [carry]
+                    length = len(carry)
+
+def _iter_text_lines(path, max_chars=TRANSCRIPT_CHUNK_CHARS):
+    """
+    Yield lines from a plain text transcript
+
+    The file is read in blocks of at most max_chars, so a file without
+    newlines is yielded in pieces at word boundaries rather than in one piece.
+
+    Args:
+        path (str): Path to the text file
+        max_chars (int): Maximum number of characters read at once
+
+    Yields:
+        str: Each line (or line piece) of the file
+    """
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as text_file:
+        carry = ""
+        while True:
+            block = text_file.readline(max_chars)
+            if not block:
+                break
+
+            line = carry + block
+            carry = ""
+            if not block.endswith("\n") and len(block) == max_chars:
+                line, carry = _cut_at_word(line)
+            yield line
+
+        if carry:
+            yield carry
+
+def _iter_line_turns(lines):
+    """
+    Yield speaker turns from free-form transcript lines (TXT and DOCX)
+
+    Teams-style "Speaker 0:03" header lines set the speaker for the lines
+    that follow. A "Label: text" prefix is only taken as a speaker change
+    when the label is a speaker already named in a header; otherwise (e.g.
+    "Date:", "Agenda:", "Note:") it applies to that line only and is not
+    reported as a known speaker.
+
+    Args:
+        lines: Iterable of transcript lines
+
+    Yields:
+        tuple: (speaker or None, text, whether the speaker is a known speaker)
+    """
+    header_speakers = set()
+    current_speaker = None
+    for line in lines:
+        line = line.strip()
+        if not line or "-->" in line:
+            continue
+
+        header = _SPEAKER_HEADER_RE.match(line)
+        if header:
+            current_speaker = header.group(1).strip()
+            header_speakers.add(current_speaker)
+            continue
+
+        line = _LEADING_TIMESTAMP_RE.sub("", line)
+        speaker, text = _split_speaker(line)
+        if speaker and speaker in header_speakers:
+            current_speaker = speaker
+            yield speaker, text, True
+        elif speaker and current_speaker is None:
+            # Label-style prefix outside any speaker section: this line only
+            yield speaker, text, False
+        else:
+            # Unprefixed line, or a label within a speaker's section
+            yield current_speaker, line, current_speaker is not None
+
+def _iter_raw_turns(path, max_chars=TRANSCRIPT_CHUNK_CHARS):
+    """
+    Yield raw speaker turns from a transcript file based on its extension
+
+    Args:
+        path (str): Path to the transcript file
+        max_chars (int): Maximum number of characters read at once
+
+    Yields:
+        tuple: (speaker or None, text, whether the speaker is a known speaker)
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".vtt", ".srt"):
+        return _iter_caption_turns(path)
+    if extension == ".docx":
+        return _iter_line_turns(_iter_docx_paragraphs(path, max_chars))
+    if extension == ".txt":
+        return _iter_line_turns(_iter_text_lines(path, max_chars))
+    raise ValueError(
+        f"Unsupported transcript format '{extension}'. "
+        f"Supported formats: {', '.join(SUPPORTED_TRANSCRIPT_EXTENSIONS)}"
+    )
+
+def iter_transcript_turns(path, max_chars=TRANSCRIPT_CHUNK_CHARS, speakers=None):
+    """
+    Stream cleaned speaker turns from a transcript file
+
+    Timestamps and filler words are dropped, text longer than max_chars is
+    split at word boundaries and consecutive turns by the same speaker are
+    merged (up to max_chars per turn).
+
+    Args:
+        path (str): Path to a VTT, SRT, DOCX or TXT transcript
+        max_chars (int): Maximum length of a merged turn
+        speakers (list, optional): Collects each known speaker name once, in
+            order of first turn (label-style prefixes such as "Date:" in
+            TXT/DOCX files are not included)
+
+    Yields:
+        tuple: (speaker or None, text)
+    """
+    current_speaker = None
+    current_parts = []
+    current_length = 0
+
+    for speaker, raw_text, known in _iter_raw_turns(path, max_chars):
+        if speakers is not None and known and speaker not in speakers:
+            speakers.append(speaker)
+
+        for text in _split_text(_clean_text(raw_text), max_chars):
+            if current_parts and (speaker != current_speaker or current_length + len(text) > max_chars):
+                yield current_speaker, " ".join(current_parts)
+                current_parts = []
+                current_length = 0
+
+            current_speaker = speaker
+            current_parts.append(text)
+            current_length += len(text) + 1
+
+    if current_parts:
+        yield current_speaker, " ".join(current_parts)
+
+def iter_transcript_chunks(path, max_chars=TRANSCRIPT_CHUNK_CHARS, speakers=None):
+    """
+    Stream a transcript file as text chunks sized for the extractor
+
+    Each chunk holds "Speaker: text" lines and stays within max_chars. A turn
+    that does not fit is split at word boundaries to fill the current chunk
+    before continuing in the next, so chunks stay close to max_chars.
+
+    Args:
+        path (str): Path to a VTT, SRT, DOCX or TXT transcript
+        max_chars (int): Maximum length of a chunk
+        speakers (list, optional): Collects each known speaker name once, in order of first turn
+
+    Yields:
+        str: Chunk of cleaned transcript text
+    """
+    # Start a new chunk rather than squeeze a sliver of a turn into this one
+    min_piece = max_chars // 10
+    lines = []
+    length = 0
+
+    for speaker, text in iter_transcript_turns(path, max_chars, speakers):
+        prefix = f"{speaker}: " if speaker else ""
+        # Leave room for the speaker prefix so no line exceeds max_chars
+        if len(prefix) > max_chars // 2:
+            prefix = ""
+        while text:
+            room = max_chars - length - len(prefix)
+            if lines and room < min(len(text), min_piece):
+                yield "\n".join(lines)
+                lines = []
+                length = 0
+                continue
+
+            piece, text = _take_words(text, room)
+            lines.append(prefix + piece)
+            length += len(prefix) + len(piece) + 1
+
+    if lines:
+        yield "\n".join(lines)
@@ -4,73 +4,26 @@ GUI implementation for the meeting minutes processor
 
 import os
 import tkinter as tk
-from tkinter import scrolledtext, messagebox, ttk
-from config.app_config import UI_WINDOW_TITLE, UI_WINDOW_SIZE, UI_INPUT_HEIGHT, UI_RESULT_HEIGHT
-from services.openai_service import process_minutes, set_api_key
+from tkinter import scrolledtext, messagebox, filedialog, ttk
+from config.app_config import UI_WINDOW_TITLE, UI_WINDOW_SIZE, UI_INPUT_HEIGHT
+from services.openai_service import process_minutes, process_transcript, set_api_key
 from services.excel_service import create_excel
 from services.json_service import save_json
-
-def _display_results(result_text, minutes_data):
-    """
-    Display the extracted data in the result text area
-    
-    Args:
-        result_text: Tkinter text widget
-        minutes_data: Minutes object
-    """
-    result_text.delete("1.0", tk.END)
-    result_text.insert(tk.END, f"Meeting: {minutes_data.meeting_title or 'Untitled'}\n")
-    result_text.insert(tk.END, f"Date: {minutes_data.meeting_date or 'Not specified'}\n")
-    result_text.insert(tk.END, f"Attendees: {', '.join(minutes_data.attendees) or 'None specified'}\n\n")
-    
-    result_text.insert(tk.END, f"Extracted Project Items ({len(minutes_data.items)}):\n\n")
-    
-    for i, item in enumerate(minutes_data.items, start=1):
-        item_dict = item.model_dump()
-        result_text.insert(tk.END, f"Item {i}:\n")
-        
-        for key, value in item_dict.items():
-            if value and value != [] and value != {}:
-                # Format lists nicely
-                if isinstance(value, list):
-                    value_str = ", ".join(value)
-                # Format enum values
-                elif hasattr(value, 'value'):
-                    value_str = value.value
-                else:
-                    value_str = str(value)
-                    
-                result_text.insert(tk.END, f"  {key}: {value_str}\n")
-        
-        result_text.insert(tk.END, "\n")
+from services.transcript_service import SUPPORTED_TRANSCRIPT_EXTENSIONS
+from ui.results_view import ResultsView
 
 def create_gui():
     """Create a simple GUI for inputting meeting minutes"""
     
-    def on_submit():
-        """Handle submit button click"""
-        # Get API key
-        api_key = api_key_entry.get()
-        if not api_key:
-            messagebox.showerror("Error", "Please enter your OpenAI API key")
-            return
-        
-        # Set API key
-        set_api_key(api_key)
-        
-        # Get minutes text
-        minutes_text = text_input.get("1.0", tk.END)
-        if not minutes_text.strip():
-            messagebox.showerror("Error", "Please enter meeting minutes")
-            return
-        
+    def _run_processing(process_fn, source):
+        """Process the given source and save/display the results"""
         status_label.config(text="Processing minutes... This may take a moment.")
         progress_bar.start(10)
         root.update()
         
         try:
             # Process the minutes
-            minutes_data = process_minutes(minutes_text)
+            minutes_data = process_fn(source)
             
             # Save as JSON
             json_path = save_json(minutes_data)
@@ -78,17 +31,69 @@ def create_gui():
             # Create Excel file
             excel_path = create_excel(minutes_data)
             
-            status_label.config(text=f"Success! Files created:\n{json_path}\n{excel_path}")
+            status_text = f"Success! Files created:\n{json_path}\n{excel_path}"
+            repair_stats = minutes_data.repair_stats
+            if repair_stats:
+                status_text += (
+                    f"\nRepaired {repair_stats.repaired} of {repair_stats.attempted} invalid field values"
+                    f" ({repair_stats.still_invalid} still invalid, {repair_stats.total_tokens} tokens)"
+                )
+            status_label.config(text=status_text)
             progress_bar.stop()
             
             # Show the extracted items in the result area
-            _display_results(result_text, minutes_data)
+            results_view.show(minutes_data)
             
         except Exception as e:
             status_label.config(text=f"Error: {str(e)}")
             progress_bar.stop()
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
     
+    def _set_api_key_from_entry():
+        """Set the API key from the entry field, returning False if missing"""
+        api_key = api_key_entry.get()
+        if not api_key:
+            messagebox.showerror("Error", "Please enter your OpenAI API key")
+            return False
+        
+        try:
+            set_api_key(api_key)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return False
+        return True
+    
+    def on_submit():
+        """Handle submit button click"""
+        if not _set_api_key_from_entry():
+            return
+        
+        # Get minutes text
+        minutes_text = text_input.get("1.0", tk.END)
+        if not minutes_text.strip():
+            messagebox.showerror("Error", "Please enter meeting minutes")
+            return
+        
+        _run_processing(process_minutes, minutes_text)
+    
+    def on_process_file():
+        """Handle transcript file button click"""
+        if not _set_api_key_from_entry():
+            return
+        
+        # Transcript files are streamed from disk rather than pasted into the text area
+        transcript_path = filedialog.askopenfilename(
+            title="Select Transcript File",
+            filetypes=[
+                ("Transcripts", " ".join(f"*{ext}" for ext in SUPPORTED_TRANSCRIPT_EXTENSIONS)),
+                ("All files", "*.*")
+            ]
+        )
+        if not transcript_path:
+            return
+        
+        _run_processing(process_transcript, transcript_path)
+    
     # Create the main window
     root = tk.Tk()
     root.title(UI_WINDOW_TITLE)
@@ -118,7 +123,7 @@ def create_gui():
         api_key_entry.insert(0, os.environ.get("OPENAI_API_KEY"))
     
     # Instructions
-    instructions = ttk.Label(main_frame, text="Copy and paste your meeting minutes below:")
+    instructions = ttk.Label(main_frame, text="Copy and paste your meeting minutes below, or process a VTT/SRT/DOCX/TXT transcript file:")
     instructions.pack(pady=10)
     
     # Text input area with frame
@@ -136,6 +141,10 @@ def create_gui():
     submit_button = ttk.Button(control_frame, text="Process Minutes", command=on_submit)
     submit_button.pack(side=tk.LEFT, padx=10)
     
+    # Transcript file button
+    file_button = ttk.Button(control_frame, text="Process Transcript File...", command=on_process_file)
+    file_button.pack(side=tk.LEFT, padx=10)
+    
     # Progress bar
     progress_bar = ttk.Progressbar(control_frame, orient="horizontal", length=300, mode="indeterminate")
     progress_bar.pack(side=tk.LEFT, padx=10, fill=tk.X, expand=True)
@@ -148,8 +157,8 @@ def create_gui():
     result_frame = ttk.LabelFrame(main_frame, text="Extracted Project Items")
     result_frame.pack(padx=10, pady=5, fill=tk.BOTH, expand=True)
     
-    result_text = scrolledtext.ScrolledText(result_frame, height=UI_RESULT_HEIGHT)
-    result_text.pack(padx=5, pady=5, fill=tk.BOTH, expand=True)
+    results_view = ResultsView(result_frame)
+    results_view.pack(padx=5, pady=5, fill=tk.BOTH, expand=True)
     
     # Start the main loop
     root.mainloop()
\ No newline at end of file
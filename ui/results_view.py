@@ -0,0 +1,235 @@
+"""
+Results grid for displaying extracted project items
+"""
+
+import re
+import tkinter as tk
+from tkinter import scrolledtext, ttk
+from config.app_config import UI_RESULT_HEIGHT, UI_RESULT_COLUMNS, UI_RESULT_CHUNK_SIZE
+
+def _format_value(value):
+    """
+    Format a project item field value for display
+
+    Args:
+        value: Field value from ProjectItem.model_dump()
+
+    Returns:
+        str: Display string ("" for empty values)
+    """
+    if value is None or value == [] or value == {}:
+        return ""
+    # Format lists nicely
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    # Format enum values
+    if hasattr(value, 'value'):
+        return value.value
+    return str(value)
+
+# Sort order for Priority values; other values sort after these
+_PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+_DIGITS_RE = re.compile(r"(\d+)")
+
+def _sort_key(column, value):
+    """
+    Build a sort key for a displayed value
+
+    Runs of digits compare as numbers ("T-2" before "T-10") and Priority
+    values sort by urgency rather than alphabetically.
+
+    Args:
+        column (str): Column being sorted
+        value (str): Display string of the cell
+
+    Returns:
+        tuple: Sort key
+    """
+    value = value.lower()
+    rank = _PRIORITY_ORDER.get(value, len(_PRIORITY_ORDER)) if column == "Priority" else 0
+    parts = tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in _DIGITS_RE.split(value) if part
+    )
+    return rank, parts
+
+class ResultsView(ttk.Frame):
+    """
+    Sortable, filterable grid of project items with a detail pane.
+
+    Rows are inserted in chunks via after() so the UI stays responsive
+    regardless of how many items a meeting produced.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        self._items = []         # Field dicts for each project item
+        self._rows = []          # (values tuple, lowercase search text) per item
+        self._order = []         # Item indexes in current sort order
+        self._sort_column = None
+        self._sort_reverse = False
+        self._populate_job = None
+        self._filter_job = None
+
+        # Meeting summary
+        self._summary_label = ttk.Label(self, text="", justify=tk.LEFT)
+        self._summary_label.pack(padx=5, pady=2, anchor=tk.W)
+
+        # Filter entry
+        filter_frame = ttk.Frame(self)
+        filter_frame.pack(padx=5, pady=2, fill=tk.X)
+        ttk.Label(filter_frame, text="Filter:").pack(side=tk.LEFT)
+        self._filter_var = tk.StringVar()
+        self._filter_var.trace_add("write", self._on_filter_changed)
+        ttk.Entry(filter_frame, textvariable=self._filter_var).pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        self._count_label = ttk.Label(filter_frame, text="")
+        self._count_label.pack(side=tk.LEFT)
+
+        panes = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
+        panes.pack(padx=5, pady=5, fill=tk.BOTH, expand=True)
+
+        # Items grid
+        tree_frame = ttk.Frame(panes)
+        self._tree = ttk.Treeview(
+            tree_frame, columns=UI_RESULT_COLUMNS, show="headings",
+            height=UI_RESULT_HEIGHT, selectmode="browse"
+        )
+        for column in UI_RESULT_COLUMNS:
+            self._tree.heading(column, text=column, command=lambda c=column: self._on_sort(c))
+            self._tree.column(column, width=100, stretch=True)
+        y_scroll = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self._tree.yview)
+        x_scroll = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self._tree.xview)
+        self._tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        self._tree.grid(row=0, column=0, sticky="nsew")
+        y_scroll.grid(row=0, column=1, sticky="ns")
+        x_scroll.grid(row=1, column=0, sticky="ew")
+        tree_frame.rowconfigure(0, weight=1)
+        tree_frame.columnconfigure(0, weight=1)
+        self._tree.bind("<<TreeviewSelect>>", self._on_select)
+        panes.add(tree_frame, weight=3)
+
+        # Detail pane
+        self._detail_text = scrolledtext.ScrolledText(panes, width=40, wrap=tk.WORD, state=tk.DISABLED)
+        panes.add(self._detail_text, weight=1)
+
+    def show(self, minutes_data):
+        """
+        Display the extracted data
+
+        Args:
+            minutes_data: Minutes object
+        """
+        self._summary_label.config(text=(
+            f"Meeting: {minutes_data.meeting_title or 'Untitled'}\n"
+            f"Date: {minutes_data.meeting_date or 'Not specified'}\n"
+            f"Attendees: {', '.join(minutes_data.attendees) or 'None specified'}"
+        ))
+
+        # Format every row once up front; sorting and filtering reuse these
+        self._items = [item.model_dump() for item in minutes_data.items]
+        self._rows = []
+        for item_dict in self._items:
+            values = tuple(_format_value(item_dict.get(column)) for column in UI_RESULT_COLUMNS)
+            search_text = " ".join(_format_value(value) for value in item_dict.values()).lower()
+            self._rows.append((values, search_text))
+
+        self._order = list(range(len(self._items)))
+        self._sort_column = None
+        self._sort_reverse = False
+        for column in UI_RESULT_COLUMNS:
+            self._tree.heading(column, text=column)
+
+        self._show_detail(None)
+        self._populate()
+
+    def _populate(self):
+        """Clear the grid and re-insert the filtered rows in chunks"""
+        if self._populate_job is not None:
+            self.after_cancel(self._populate_job)
+            self._populate_job = None
+
+        self._tree.delete(*self._tree.get_children())
+
+        query = self._filter_var.get().strip().lower()
+        if query:
+            visible = [index for index in self._order if query in self._rows[index][1]]
+        else:
+            visible = self._order
+        self._count_label.config(text=f"{len(visible)} of {len(self._rows)} items")
+
+        self._insert_chunk(visible, 0)
+
+    def _insert_chunk(self, visible, start):
+        """
+        Insert one chunk of rows and schedule the next
+
+        Args:
+            visible (list): Item indexes to display, in order
+            start (int): Position in visible to start from
+        """
+        end = min(start + UI_RESULT_CHUNK_SIZE, len(visible))
+        for index in visible[start:end]:
+            self._tree.insert("", tk.END, iid=str(index), values=self._rows[index][0])
+
+        if end < len(visible):
+            self._populate_job = self.after(1, self._insert_chunk, visible, end)
+        else:
+            self._populate_job = None
+
+    def _on_sort(self, column):
+        """Sort the grid by a column, toggling direction on repeated clicks"""
+        if self._sort_column == column:
+            self._sort_reverse = not self._sort_reverse
+        else:
+            self._sort_column = column
+            self._sort_reverse = False
+
+        column_index = UI_RESULT_COLUMNS.index(column)
+        # Keep empty values at the bottom in both directions
+        filled = [i for i in self._order if self._rows[i][0][column_index]]
+        empty = [i for i in self._order if not self._rows[i][0][column_index]]
+        filled.sort(key=lambda i: _sort_key(column, self._rows[i][0][column_index]), reverse=self._sort_reverse)
+        self._order = filled + empty
+
+        for name in UI_RESULT_COLUMNS:
+            arrow = (" ▼" if self._sort_reverse else " ▲") if name == column else ""
+            self._tree.heading(name, text=name + arrow)
+
+        self._populate()
+
+    def _on_filter_changed(self, *args):
+        """Re-filter the grid shortly after the user stops typing"""
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(200, self._apply_filter)
+
+    def _apply_filter(self):
+        """Apply the current filter text"""
+        self._filter_job = None
+        self._show_detail(None)
+        self._populate()
+
+    def _on_select(self, event):
+        """Show the selected item in the detail pane"""
+        selection = self._tree.selection()
+        self._show_detail(int(selection[0]) if selection else None)
+
+    def _show_detail(self, index):
+        """
+        Show every non-empty field of an item in the detail pane
+
+        Args:
+            index (int): Index of the item, or None to clear the pane
+        """
+        self._detail_text.config(state=tk.NORMAL)
+        self._detail_text.delete("1.0", tk.END)
+        if index is not None:
+            lines = []
+            for key, value in self._items[index].items():
+                value_str = _format_value(value)
+                if value_str:
+                    lines.append(f"{key}: {value_str}")
+            self._detail_text.insert(tk.END, "\n".join(lines))
+        self._detail_text.config(state=tk.DISABLED)
\ No newline at end of file